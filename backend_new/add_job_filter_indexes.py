@@ -0,0 +1,29 @@
+# add_job_filter_indexes.py
+import sys
+import os
+sys.path.append('.')
+
+from main import SessionLocal
+from sqlalchemy import text
+
+# Indexes backing the category, budget and experience filters in GET /api/jobs
+INDEXES = {
+    "ix_jobs_status_category_created_at": "CREATE INDEX IF NOT EXISTS ix_jobs_status_category_created_at ON jobs (status, category, created_at)",
+    "ix_jobs_status_budget_type_budget_min": "CREATE INDEX IF NOT EXISTS ix_jobs_status_budget_type_budget_min ON jobs (status, budget_type, budget_min)",
+    "ix_jobs_experience_level": "CREATE INDEX IF NOT EXISTS ix_jobs_experience_level ON jobs (experience_level)",
+}
+
+print("Adding job filter indexes...")
+
+db = SessionLocal()
+try:
+    for name, statement in INDEXES.items():
+        db.execute(text(statement))
+        print(f"✅ Index '{name}' is in place")
+    db.commit()
+        
+except Exception as e:
+    print(f"❌ Error: {e}")
+    db.rollback()
+finally:
+    db.close()
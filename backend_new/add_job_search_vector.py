@@ -0,0 +1,39 @@
+# add_job_search_vector.py
+import sys
+import os
+sys.path.append('.')
+
+from main import SessionLocal, JOB_SEARCH_VECTOR_SQL
+from sqlalchemy import text
+
+print("Checking and adding full-text search column to jobs table...")
+
+db = SessionLocal()
+try:
+    # Check if column exists
+    result = db.execute(text("""
+        SELECT column_name 
+        FROM information_schema.columns 
+        WHERE table_name='jobs' AND column_name='search_vector'
+    """))
+    
+    if result.fetchone() is None:
+        print("Adding 'search_vector' column (this rewrites the jobs table)...")
+        db.execute(text(f"""
+            ALTER TABLE jobs 
+            ADD COLUMN search_vector tsvector 
+            GENERATED ALWAYS AS ({JOB_SEARCH_VECTOR_SQL}) STORED
+        """))
+        print("✅ Successfully added 'search_vector' column")
+    else:
+        print("✅ 'search_vector' column already exists")
+    
+    db.execute(text("CREATE INDEX IF NOT EXISTS ix_jobs_search_vector ON jobs USING gin (search_vector)"))
+    db.commit()
+    print("✅ GIN index 'ix_jobs_search_vector' is in place")
+        
+except Exception as e:
+    print(f"❌ Error: {e}")
+    db.rollback()
+finally:
+    db.close()
@@ -0,0 +1,28 @@
+# add_message_indexes.py
+import sys
+import os
+sys.path.append('.')
+
+from main import SessionLocal
+from sqlalchemy import text
+
+# Composite indexes backing the message thread listing and unread counts
+INDEXES = {
+    "ix_messages_sender_receiver_created_at_id": "CREATE INDEX IF NOT EXISTS ix_messages_sender_receiver_created_at_id ON messages (sender_id, receiver_id, created_at, id)",
+    "ix_messages_receiver_is_read": "CREATE INDEX IF NOT EXISTS ix_messages_receiver_is_read ON messages (receiver_id, is_read)",
+}
+
+print("Adding message indexes...")
+
+db = SessionLocal()
+try:
+    for name, statement in INDEXES.items():
+        db.execute(text(statement))
+        print(f"✅ Index '{name}' is in place")
+    db.commit()
+        
+except Exception as e:
+    print(f"❌ Error: {e}")
+    db.rollback()
+finally:
+    db.close()
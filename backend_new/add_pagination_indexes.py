@@ -0,0 +1,29 @@
+# add_pagination_indexes.py
+import sys
+import os
+sys.path.append('.')
+
+from main import SessionLocal
+from sqlalchemy import text
+
+# Composite indexes backing the (created_at, id) keyset cursors
+INDEXES = {
+    "ix_jobs_status_created_at_id": "CREATE INDEX IF NOT EXISTS ix_jobs_status_created_at_id ON jobs (status, created_at, id)",
+    "ix_proposals_freelancer_submitted_at_id": "CREATE INDEX IF NOT EXISTS ix_proposals_freelancer_submitted_at_id ON proposals (freelancer_id, submitted_at, id)",
+    "ix_messages_sender_receiver_created_at_id": "CREATE INDEX IF NOT EXISTS ix_messages_sender_receiver_created_at_id ON messages (sender_id, receiver_id, created_at, id)",
+}
+
+print("Adding pagination indexes...")
+
+db = SessionLocal()
+try:
+    for name, statement in INDEXES.items():
+        db.execute(text(statement))
+        print(f"✅ Index '{name}' is in place")
+    db.commit()
+        
+except Exception as e:
+    print(f"❌ Error: {e}")
+    db.rollback()
+finally:
+    db.close()
@@ -0,0 +1,35 @@
+# add_user_email_index.py
+import sys
+import os
+sys.path.append('.')
+
+from main import SessionLocal
+from sqlalchemy import text
+
+# Unique functional index backing the case-insensitive username-or-email
+# login lookup; it also rejects emails that differ only in case
+print("Adding unique lower(email) index to users table...")
+
+db = SessionLocal()
+try:
+    duplicates = db.execute(text(
+        "SELECT lower(email), array_agg(username ORDER BY id) FROM users "
+        "GROUP BY lower(email) HAVING count(*) > 1"
+    )).all()
+    if duplicates:
+        print("❌ These emails are registered more than once (ignoring case); merge or rename them first:")
+        for email, usernames in duplicates:
+            print(f"   {email}: {', '.join(usernames)}")
+        sys.exit(1)
+    
+    # Replaces the earlier non-unique version of the index, if present
+    db.execute(text("DROP INDEX IF EXISTS ix_users_email_lower"))
+    db.execute(text("CREATE UNIQUE INDEX ix_users_email_lower ON users (lower(email))"))
+    db.commit()
+    print("✅ Unique index 'ix_users_email_lower' is in place")
+        
+except Exception as e:
+    print(f"❌ Error: {e}")
+    db.rollback()
+finally:
+    db.close()
@@ -0,0 +1,105 @@
+# app_logging.py
+# Logging setup for the SkillLink API.
+#
+# Request handlers only put records on an in-memory queue; a background
+# QueueListener thread formats and writes them, so a slow stdout never
+# blocks a request.
+#
+# Configuration (environment):
+#   LOG_LEVEL        DEBUG | INFO | WARNING | ERROR      (default INFO)
+#   LOG_FORMAT       json | text                        (default json)
+#   LOG_SAMPLE_RATE  fraction of DEBUG/INFO records kept (default 1.0);
+#                    warnings and errors are never sampled out
+import os
+import sys
+import json
+import atexit
+import copy
+import random
+import logging
+import logging.handlers
+import queue
+from datetime import datetime, timezone
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json").lower()
+LOG_SAMPLE_RATE = float(os.getenv("LOG_SAMPLE_RATE", "1.0"))
+
+# Attributes every LogRecord has; anything else was passed via extra=
+_RESERVED_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, including any fields passed with extra=."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """Keep a random fraction of records below WARNING."""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= logging.WARNING or self.rate >= 1.0 or random.random() < self.rate
+
+
+class StructuredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that keeps the message and traceback as separate fields.
+    
+    The stock handler folds the traceback into the message text before
+    queueing, which would hide it from the JSON formatter.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+_listener = None
+
+
+def setup_logging() -> logging.Logger:
+    """Route the app's logs through a queue to stdout; safe to call more than once."""
+    global _listener
+    logger = logging.getLogger("skilllink")
+    if _listener is not None:
+        return logger
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    if LOG_FORMAT == "json":
+        stream_handler.setFormatter(JsonFormatter())
+    else:
+        stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = StructuredQueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter(LOG_SAMPLE_RATE))
+
+    logger.setLevel(LOG_LEVEL)
+    logger.addHandler(queue_handler)
+    logger.propagate = False
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+    return logger
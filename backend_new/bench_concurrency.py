@@ -0,0 +1,68 @@
+# bench_concurrency.py
+# Fires concurrent requests at a running backend and reports throughput/latency.
+#
+# Usage:
+#   python bench_concurrency.py <username> <password> [concurrency] [requests]
+#
+# Run it against the server before and after a change to compare, e.g.
+#   uvicorn main:app --port 8000
+#   python bench_concurrency.py alice secret 50 1000
+import sys
+import json
+import time
+import statistics
+import urllib.request
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+BASE_URL = "http://127.0.0.1:8000"
+ENDPOINTS = [
+    "/api/contracts",
+    "/api/contracts/stats",
+    "/api/messages/threads",
+    "/api/messages/unread/count",
+]
+
+if len(sys.argv) < 3:
+    print("Usage: python bench_concurrency.py <username> <password> [concurrency] [requests]")
+    sys.exit(1)
+
+username, password = sys.argv[1], sys.argv[2]
+concurrency = int(sys.argv[3]) if len(sys.argv) > 3 else 50
+total_requests = int(sys.argv[4]) if len(sys.argv) > 4 else 1000
+
+print(f"Logging in as {username}...")
+login_data = urllib.parse.urlencode({"username": username, "password": password}).encode()
+with urllib.request.urlopen(f"{BASE_URL}/token", data=login_data) as resp:
+    token = json.loads(resp.read())["access_token"]
+
+
+def hit(i):
+    path = ENDPOINTS[i % len(ENDPOINTS)]
+    req = urllib.request.Request(f"{BASE_URL}{path}", headers={"Authorization": f"Bearer {token}"})
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(req) as resp:
+            resp.read()
+            ok = resp.status == 200
+    except Exception:
+        ok = False
+    return time.perf_counter() - start, ok
+
+
+print(f"Sending {total_requests} requests with concurrency {concurrency}...")
+started = time.perf_counter()
+with ThreadPoolExecutor(max_workers=concurrency) as pool:
+    results = list(pool.map(hit, range(total_requests)))
+elapsed = time.perf_counter() - started
+
+latencies = sorted(r[0] * 1000 for r in results)
+failures = sum(1 for r in results if not r[1])
+
+print(f"✅ Done in {elapsed:.2f}s")
+print(f"   Throughput: {total_requests / elapsed:.1f} req/s")
+print(f"   Latency p50: {statistics.median(latencies):.1f} ms")
+print(f"   Latency p95: {latencies[int(len(latencies) * 0.95) - 1]:.1f} ms")
+print(f"   Latency max: {latencies[-1]:.1f} ms")
+if failures:
+    print(f"❌ {failures} requests failed")
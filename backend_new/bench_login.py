@@ -0,0 +1,85 @@
+# bench_login.py
+# Measures /token throughput against a running backend.
+#
+# Usage:
+#   python bench_login.py [concurrency] [requests]
+#
+# Creates a throwaway user, then logs in with it concurrently. Compare runs
+# with different PASSWORD_SCHEME / PASSWORD_HASH_WORKERS settings, e.g.
+#   PASSWORD_HASH_WORKERS=0 uvicorn main:app --port 8000
+#   PASSWORD_HASH_WORKERS=4 uvicorn main:app --port 8000
+import sys
+import json
+import time
+import uuid
+import statistics
+import urllib.request
+import urllib.parse
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+
+BASE_URL = "http://127.0.0.1:8000"
+
+concurrency = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+total_requests = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+username = f"bench_{uuid.uuid4().hex[:8]}"
+password = "bench-password-123"
+
+print(f"Registering {username}...")
+register_body = json.dumps({
+    "username": username,
+    "email": f"{username}@example.com",
+    "password": password,
+    "user_type": "freelancer"
+}).encode()
+register_req = urllib.request.Request(
+    f"{BASE_URL}/register", data=register_body, headers={"Content-Type": "application/json"}
+)
+urllib.request.urlopen(register_req).read()
+
+login_data = urllib.parse.urlencode({"username": username, "password": password}).encode()
+
+
+def login(_):
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(f"{BASE_URL}/token", data=login_data) as resp:
+            resp.read()
+            status = resp.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+    except Exception:
+        status = None
+    return time.perf_counter() - start, status
+
+
+def probe(_):
+    # A cheap request issued alongside the logins shows whether hashing starves other traffic
+    start = time.perf_counter()
+    with urllib.request.urlopen(f"{BASE_URL}/api/health") as resp:
+        resp.read()
+    return time.perf_counter() - start
+
+
+print(f"Sending {total_requests} logins with concurrency {concurrency}...")
+started = time.perf_counter()
+with ThreadPoolExecutor(max_workers=concurrency + 1) as pool:
+    probes = pool.map(probe, range(total_requests // 10 or 1))
+    results = list(pool.map(login, range(total_requests)))
+    probe_latencies = sorted(p * 1000 for p in probes)
+elapsed = time.perf_counter() - started
+
+latencies = sorted(r[0] * 1000 for r in results)
+# 503 means the hashing pool's queue (PASSWORD_HASH_QUEUE) was full
+busy = sum(1 for r in results if r[1] == 503)
+failures = sum(1 for r in results if r[1] not in (200, 503))
+
+print(f"✅ Done in {elapsed:.2f}s")
+print(f"   Logins/s: {total_requests / elapsed:.1f}")
+print(f"   Login latency p50: {statistics.median(latencies):.1f} ms, p95: {latencies[int(len(latencies) * 0.95) - 1]:.1f} ms")
+print(f"   /api/health latency during the run p50: {statistics.median(probe_latencies):.1f} ms, max: {probe_latencies[-1]:.1f} ms")
+if busy:
+    print(f"⚠️  {busy} logins rejected with 503 while the hashing pool was full")
+if failures:
+    print(f"❌ {failures} logins failed")
@@ -0,0 +1,58 @@
+# build_conversations.py
+import sys
+import os
+sys.path.append('.')
+
+from main import engine, SessionLocal, Conversation
+from sqlalchemy import text
+
+print("Building conversations table from existing messages...")
+
+# Create the conversations table if it doesn't exist yet
+Conversation.__table__.create(bind=engine, checkfirst=True)
+
+db = SessionLocal()
+try:
+    # Latest message per ordered user pair, plus what each side has left unread.
+    # Re-running rebuilds every row, so this also repairs drifted counters.
+    result = db.execute(text("""
+        WITH last_messages AS (
+            SELECT DISTINCT ON (LEAST(sender_id, receiver_id), GREATEST(sender_id, receiver_id))
+                LEAST(sender_id, receiver_id) AS user_a_id,
+                GREATEST(sender_id, receiver_id) AS user_b_id,
+                id,
+                created_at
+            FROM messages
+            ORDER BY LEAST(sender_id, receiver_id), GREATEST(sender_id, receiver_id), created_at DESC, id DESC
+        ),
+        unread AS (
+            SELECT receiver_id, sender_id, COUNT(*) AS unread_count
+            FROM messages
+            WHERE is_read = false
+            GROUP BY receiver_id, sender_id
+        )
+        INSERT INTO conversations (user_a_id, user_b_id, last_message_id, last_message_at, unread_a, unread_b)
+        SELECT
+            lm.user_a_id,
+            lm.user_b_id,
+            lm.id,
+            lm.created_at,
+            COALESCE(ua.unread_count, 0),
+            COALESCE(ub.unread_count, 0)
+        FROM last_messages lm
+        LEFT JOIN unread ua ON ua.receiver_id = lm.user_a_id AND ua.sender_id = lm.user_b_id
+        LEFT JOIN unread ub ON ub.receiver_id = lm.user_b_id AND ub.sender_id = lm.user_a_id
+        ON CONFLICT (user_a_id, user_b_id) DO UPDATE SET
+            last_message_id = EXCLUDED.last_message_id,
+            last_message_at = EXCLUDED.last_message_at,
+            unread_a = EXCLUDED.unread_a,
+            unread_b = EXCLUDED.unread_b
+    """))
+    db.commit()
+    print(f"✅ Built {result.rowcount} conversation(s)")
+        
+except Exception as e:
+    print(f"❌ Error: {e}")
+    db.rollback()
+finally:
+    db.close()
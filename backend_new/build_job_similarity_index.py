@@ -0,0 +1,57 @@
+# build_job_similarity_index.py
+# Usage: python build_job_similarity_index.py [--rebuild]
+import sys
+import os
+sys.path.append('.')
+
+from main import SessionLocal, Job, compute_job_signature
+from sqlalchemy import text
+
+BATCH_SIZE = 500
+
+rebuild = "--rebuild" in sys.argv
+
+print("Building MinHash signatures for the similar-jobs index...")
+
+db = SessionLocal()
+try:
+    # Check if column exists
+    result = db.execute(text("""
+        SELECT column_name 
+        FROM information_schema.columns 
+        WHERE table_name='jobs' AND column_name='minhash_signature'
+    """))
+    
+    if result.fetchone() is None:
+        print("Adding 'minhash_signature' column...")
+        db.execute(text("ALTER TABLE jobs ADD COLUMN minhash_signature BYTEA"))
+        db.commit()
+        print("✅ Successfully added 'minhash_signature' column")
+    
+    query = db.query(Job.id, Job.title, Job.description, Job.skills_required)
+    if not rebuild:
+        query = query.filter(Job.minhash_signature.is_(None))
+    
+    signed = 0
+    last_id = 0
+    while True:
+        batch = query.filter(Job.id > last_id).order_by(Job.id).limit(BATCH_SIZE).all()
+        if not batch:
+            break
+        for job in batch:
+            db.query(Job).filter(Job.id == job.id).update(
+                {Job.minhash_signature: compute_job_signature(job)},
+                synchronize_session=False
+            )
+        db.commit()
+        signed += len(batch)
+        last_id = batch[-1].id
+        print(f"   Signed {signed} job(s)...")
+    
+    print(f"✅ Signed {signed} job(s)")
+        
+except Exception as e:
+    print(f"❌ Error: {e}")
+    db.rollback()
+finally:
+    db.close()
@@ -0,0 +1,50 @@
+# migrate_skills.py
+import sys
+import os
+sys.path.append('.')
+
+from main import engine, SessionLocal, Job, User, Skill, JobSkill, UserSkill, parse_skills, get_skill_ids, normalize_skill
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+print("Migrating comma-separated skills into the skills tables...")
+
+# Create the skills tables if they don't exist yet
+for table in (Skill.__table__, JobSkill.__table__, UserSkill.__table__):
+    table.create(bind=engine, checkfirst=True)
+
+db = SessionLocal()
+try:
+    jobs = db.query(Job.id, Job.skills_required).filter(Job.skills_required.isnot(None)).all()
+    users = db.query(User.id, User.skills).filter(User.skills.isnot(None)).all()
+    
+    # Register every skill name up front so the join rows need no further lookups
+    all_names = []
+    for _, skills_csv in jobs + users:
+        all_names.extend(parse_skills(skills_csv))
+    skill_ids = get_skill_ids(db, all_names)
+    print(f"✅ Skills dictionary holds {len(skill_ids)} skill(s) from existing data")
+    
+    job_rows = [
+        {"job_id": job_id, "skill_id": skill_ids[normalize_skill(name)]}
+        for job_id, skills_csv in jobs
+        for name in parse_skills(skills_csv)
+    ]
+    user_rows = [
+        {"user_id": user_id, "skill_id": skill_ids[normalize_skill(name)]}
+        for user_id, skills_csv in users
+        for name in parse_skills(skills_csv)
+    ]
+    
+    if job_rows:
+        db.execute(pg_insert(JobSkill).on_conflict_do_nothing(), job_rows)
+    if user_rows:
+        db.execute(pg_insert(UserSkill).on_conflict_do_nothing(), user_rows)
+    db.commit()
+    
+    print(f"✅ Linked {len(job_rows)} job skill(s) and {len(user_rows)} user skill(s)")
+        
+except Exception as e:
+    print(f"❌ Error: {e}")
+    db.rollback()
+finally:
+    db.close()
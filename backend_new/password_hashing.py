@@ -0,0 +1,149 @@
+# password_hashing.py
+# Password hashing for SkillLink.
+#
+# Hashes are computed in a small process pool so a burst of logins cannot
+# hold the GIL and starve the API's worker threads. Callers await the result
+# on the event loop, so a waiting login holds no thread either. This lives
+# outside main.py so the functions the pool runs never need the app module
+# to be importable.
+#
+# Configuration (environment):
+#   PASSWORD_SCHEME            argon2 | bcrypt | sha256_crypt (default: best available)
+#   PASSWORD_ARGON2_TIME_COST  argon2 iterations            (default 2)
+#   PASSWORD_ARGON2_MEMORY_KB  argon2 memory cost in KiB     (default 19456)
+#   PASSWORD_BCRYPT_ROUNDS     bcrypt log2 rounds            (default 12)
+#   PASSWORD_HASH_WORKERS      pool size, 0 hashes in the threadpool (default: CPU count, max 4)
+#   PASSWORD_HASH_QUEUE        hashes allowed in flight before callers get
+#                              HashingPoolBusy                (default: 16 per worker,
+#                              at most what cap_queue() allows)
+import os
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Tuple
+
+from passlib.context import CryptContext
+from passlib.hash import argon2, bcrypt
+
+# Every scheme we can verify; hashes in any scheme other than the preferred
+# one are upgraded on the user's next successful login
+KNOWN_SCHEMES = ["argon2", "bcrypt", "sha256_crypt"]
+
+logger = logging.getLogger("skilllink.passwords")
+
+
+def _available_schemes():
+    available = []
+    if argon2.has_backend():
+        available.append("argon2")
+    if bcrypt.has_backend():
+        available.append("bcrypt")
+    available.append("sha256_crypt")
+    return available
+
+
+def _build_context() -> CryptContext:
+    available = _available_schemes()
+    preferred = os.getenv("PASSWORD_SCHEME", available[0])
+    if preferred not in available:
+        logger.warning("Password scheme %r is not available, using %r", preferred, available[0])
+        preferred = available[0]
+
+    schemes = [preferred] + [scheme for scheme in KNOWN_SCHEMES if scheme in available and scheme != preferred]
+    return CryptContext(
+        schemes=schemes,
+        default=preferred,
+        deprecated="auto",
+        argon2__time_cost=int(os.getenv("PASSWORD_ARGON2_TIME_COST", "2")),
+        argon2__memory_cost=int(os.getenv("PASSWORD_ARGON2_MEMORY_KB", "19456")),
+        argon2__parallelism=1,
+        bcrypt__rounds=int(os.getenv("PASSWORD_BCRYPT_ROUNDS", "12")),
+    )
+
+
+pwd_context = _build_context()
+
+HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(os.cpu_count() or 1, 4))))
+HASH_QUEUE = int(os.getenv("PASSWORD_HASH_QUEUE", str(max(HASH_WORKERS, 1) * 16)))
+_HASH_QUEUE_CONFIGURED = "PASSWORD_HASH_QUEUE" in os.environ
+_executor: Optional[ProcessPoolExecutor] = None
+_in_flight = 0
+
+
+class HashingPoolBusy(Exception):
+    """Raised instead of queueing when PASSWORD_HASH_QUEUE hashes are already in flight."""
+
+
+def _get_executor() -> Optional[ProcessPoolExecutor]:
+    global _executor
+    if HASH_WORKERS <= 0:
+        return None
+    if _executor is None:
+        # Never fork the app process itself: by startup it already runs the
+        # log listener, the realtime listener and holds pooled connections.
+        # Workers come from a clean forkserver (or spawn) instead.
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        _executor = ProcessPoolExecutor(max_workers=HASH_WORKERS, mp_context=multiprocessing.get_context(method))
+    return _executor
+
+
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify_and_update(password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    try:
+        return pwd_context.verify_and_update(password, hashed_password)
+    except (ValueError, TypeError):
+        # Unrecognised or malformed hash: never fall back to comparing plaintext
+        return False, None
+
+
+async def _run(fn, *args):
+    global _in_flight
+    if _in_flight >= HASH_QUEUE:
+        raise HashingPoolBusy()
+    _in_flight += 1
+    try:
+        # With no pool, run_in_executor(None) uses the loop's default threadpool
+        return await asyncio.get_running_loop().run_in_executor(_get_executor(), fn, *args)
+    finally:
+        _in_flight -= 1
+
+
+async def hash_password(password: str) -> str:
+    """Hash a password with the preferred scheme."""
+    return await _run(_hash, password)
+
+
+async def verify_password(password: str, hashed_password: Optional[str]) -> Tuple[bool, Optional[str]]:
+    """Check a password.
+
+    Returns (valid, new_hash). new_hash is set when the stored hash uses an
+    outdated scheme or cost and should be replaced.
+    """
+    if not hashed_password:
+        return False, None
+    return await _run(_verify_and_update, password, hashed_password)
+
+
+def cap_queue(limit: int):
+    """Lower the default in-flight limit; an explicit PASSWORD_HASH_QUEUE is kept."""
+    global HASH_QUEUE
+    if not _HASH_QUEUE_CONFIGURED:
+        HASH_QUEUE = min(HASH_QUEUE, limit)
+
+
+def start():
+    """Start the pool's first worker so the first login doesn't wait for it."""
+    executor = _get_executor()
+    if executor is not None:
+        executor.submit(len, "").result()
+
+
+def shutdown():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
@@ -0,0 +1,25 @@
+# purge_refresh_tokens.py
+import sys
+import os
+sys.path.append('.')
+
+from main import SessionLocal, RefreshToken
+from datetime import datetime
+
+# Expired and revoked refresh tokens are only kept to detect replays until
+# they expire; run this periodically to keep the table small.
+print("Purging expired refresh tokens...")
+
+db = SessionLocal()
+try:
+    deleted = db.query(RefreshToken).filter(
+        RefreshToken.expires_at < datetime.utcnow()
+    ).delete(synchronize_session=False)
+    db.commit()
+    print(f"✅ Removed {deleted} expired refresh tokens")
+        
+except Exception as e:
+    print(f"❌ Error: {e}")
+    db.rollback()
+finally:
+    db.close()
@@ -0,0 +1,36 @@
+# reconcile_proposals_count.py
+import sys
+import os
+sys.path.append('.')
+
+from main import SessionLocal, reconcile_proposals_counts
+from sqlalchemy import text
+
+print("Checking proposals_count column on jobs table...")
+
+db = SessionLocal()
+try:
+    # Check if column exists
+    result = db.execute(text("""
+        SELECT column_name 
+        FROM information_schema.columns 
+        WHERE table_name='jobs' AND column_name='proposals_count'
+    """))
+    
+    if result.fetchone() is None:
+        print("Adding 'proposals_count' column...")
+        db.execute(text("ALTER TABLE jobs ADD COLUMN proposals_count INTEGER NOT NULL DEFAULT 0"))
+        db.commit()
+        print("✅ Successfully added 'proposals_count' column")
+    else:
+        print("✅ 'proposals_count' column already exists")
+    
+    # Backfill on first run, repair drift on every later run
+    fixed = reconcile_proposals_counts(db)
+    print(f"✅ Reconciled proposals_count for {fixed} job(s)")
+        
+except Exception as e:
+    print(f"❌ Error: {e}")
+    db.rollback()
+finally:
+    db.close()
@@ -1,6 +1,6 @@
 import React, { createContext, useState, useContext, useEffect } from 'react';
 import { useNavigate } from 'react-router-dom';
-import { API } from '../utils/api';
+import { API, clearSession } from '../utils/api';
 import toast from 'react-hot-toast';
 
 const AuthContext = createContext();
@@ -31,8 +31,7 @@ export const AuthProvider = ({ children }) => {
       }
     } catch (error) {
       console.error('Auth check failed:', error);
-      localStorage.removeItem('token');
-      localStorage.removeItem('user');
+      clearSession();
     } finally {
       setLoading(false);
     }
@@ -44,6 +43,7 @@ export const AuthProvider = ({ children }) => {
       
       if (data.access_token) {
         localStorage.setItem('token', data.access_token);
+        localStorage.setItem('refresh_token', data.refresh_token);
         localStorage.setItem('user', JSON.stringify(data.user));
         setUser(data.user);
         
@@ -78,6 +78,7 @@ export const AuthProvider = ({ children }) => {
         
         if (loginData.access_token) {
           localStorage.setItem('token', loginData.access_token);
+          localStorage.setItem('refresh_token', loginData.refresh_token);
           localStorage.setItem('user', JSON.stringify(data));
           setUser(data);
           
@@ -101,8 +102,11 @@ export const AuthProvider = ({ children }) => {
   };
 
   const logout = () => {
-    localStorage.removeItem('token');
-    localStorage.removeItem('user');
+    const refreshToken = localStorage.getItem('refresh_token');
+    if (refreshToken) {
+      API.auth.revoke(refreshToken).catch(() => {});
+    }
+    clearSession();
     setUser(null);
     navigate('/');
     toast.success('Logged out successfully!');
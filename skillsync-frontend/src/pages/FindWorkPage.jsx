@@ -26,6 +26,7 @@ import {
   Heart
 } from 'lucide-react';
 import { toast } from 'react-hot-toast';
+import { clearSession } from '../utils/api';
 
 const FindWorkPage = () => {
   const [jobs, setJobs] = useState([]);
@@ -92,8 +93,7 @@ const FindWorkPage = () => {
       if (!response.ok) {
         if (response.status === 401) {
           toast.error('Session expired. Please login again.');
-          localStorage.removeItem('token');
-          localStorage.removeItem('user');
+          clearSession();
           navigate('/login');
           return;
         }
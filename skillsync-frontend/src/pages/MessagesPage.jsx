@@ -60,7 +60,7 @@ const MessagesPage = () => {
         setCurrentUser(response.data);
         
         // Initialize WebSocket
-        initWebSocket(response.data.id);
+        initWebSocket(response.data.id, token);
       } catch (error) {
         console.error('Error fetching current user:', error);
       }
@@ -81,8 +81,8 @@ const MessagesPage = () => {
   }, []);
 
   // Initialize WebSocket connection
-  const initWebSocket = (userId) => {
-    const ws = new WebSocket(`ws://127.0.0.1:8000/ws/${userId}`);
+  const initWebSocket = (userId, token) => {
+    const ws = new WebSocket(`ws://127.0.0.1:8000/ws/${userId}?token=${encodeURIComponent(token)}`);
     
     ws.onopen = () => {
       console.log('WebSocket connected');
@@ -91,12 +91,21 @@ const MessagesPage = () => {
     ws.onmessage = (event) => {
       const data = JSON.parse(event.data);
       
-      if (data.type === 'new_message') {
+      if (data.type === 'ping') {
+        // Heartbeat: answer so the server keeps this connection
+        ws.send(JSON.stringify({ type: 'pong' }));
+      } else if (data.type === 'new_message') {
         handleNewMessage(data.message);
       } else if (data.type === 'typing') {
         handleTypingIndicator(data);
       } else if (data.type === 'message_read') {
         handleMessageRead(data);
+      } else if (data.type === 'unread_count') {
+        setUnreadCount(prev => Math.max(prev + data.delta, 0));
+      } else if (data.type === 'ack' && data.command === 'send') {
+        handleSendAck(data);
+      } else if (data.type === 'error') {
+        toast.error(data.detail || 'Message failed');
       }
     };
     
@@ -136,9 +145,8 @@ const MessagesPage = () => {
       }, 100);
     }
     
-    // Update threads
+    // Update threads; the unread count arrives as its own event
     fetchThreads();
-    fetchUnreadCount();
     
     // Show notification for new messages not in current conversation
     if (!activeThread || message.sender_id !== activeThread.other_user_id) {
@@ -174,6 +182,15 @@ const MessagesPage = () => {
     );
   };
 
+  // Replace the pending id of a message sent over the socket with the stored id
+  const handleSendAck = (data) => {
+    setMessages(prev =>
+      prev.map(msg =>
+        msg.id === data.client_id ? { ...msg, id: data.message.id } : msg
+      )
+    );
+  };
+
   // Fetch message threads
   const fetchThreads = async () => {
     try {
@@ -276,20 +293,34 @@ const MessagesPage = () => {
     }
     
     try {
-      const token = localStorage.getItem('token');
-      const response = await axios.post(
-        `${API_BASE_URL}/api/messages/send`,
-        {
+      let messageId;
+      if (websocket && websocket.readyState === WebSocket.OPEN) {
+        // Send over the socket; the server acks with the stored message
+        messageId = `pending-${Date.now()}`;
+        websocket.send(JSON.stringify({
+          type: 'send',
+          client_id: messageId,
           receiver_id: activeThread.other_user_id,
           content: newMessage,
           job_id: activeThread.job_id || null
-        },
-        { headers: { Authorization: `Bearer ${token}` } }
-      );
+        }));
+      } else {
+        const token = localStorage.getItem('token');
+        const response = await axios.post(
+          `${API_BASE_URL}/api/messages/send`,
+          {
+            receiver_id: activeThread.other_user_id,
+            content: newMessage,
+            job_id: activeThread.job_id || null
+          },
+          { headers: { Authorization: `Bearer ${token}` } }
+        );
+        messageId = response.data.id;
+      }
       
       // Add message to local state immediately
       const newMessageObj = {
-        id: response.data.id,
+        id: messageId,
         sender_id: currentUser.id,
         sender_name: currentUser.full_name || 'You',
         sender_type: 'user',
@@ -20,6 +20,7 @@ import {
   Loader2
 } from 'lucide-react';
 import { toast } from 'react-hot-toast';
+import { clearSession } from '../utils/api';
 
 const ProposalsPage = () => {
   const [proposals, setProposals] = useState([]);
@@ -57,7 +58,7 @@ const ProposalsPage = () => {
       );
       
       if (response.status === 401) {
-        localStorage.removeItem('token');
+        clearSession();
         window.location.href = '/login';
         return;
       }
@@ -1,4 +1,5 @@
 import axios from 'axios';
+import { retryWithRefreshedToken } from '../utils/api';
 
 const API_URL = 'http://localhost:8000';
 
@@ -18,6 +19,9 @@ api.interceptors.request.use((config) => {
   return config;
 });
 
+// Refresh an expired access token and retry, like the main client
+api.interceptors.response.use((response) => response, retryWithRefreshedToken(api));
+
 // Freelancer API calls
 export const freelancerApi = {
   // Profile
@@ -23,19 +23,123 @@ api.interceptors.request.use(
   }
 );
 
-// Response interceptor
-api.interceptors.response.use(
-  (response) => response.data,
-  (error) => {
-    if (error.response?.status === 401) {
-      localStorage.removeItem('token');
-      localStorage.removeItem('user');
-      window.location.href = '/login';
+// Pages still address the dev server by either name, or through API_URL
+const API_ORIGINS = [API_URL, 'http://localhost:8000', 'http://127.0.0.1:8000'];
+
+const apiPath = (url = '') => {
+  const origin = API_ORIGINS.find((candidate) => url.startsWith(candidate));
+  return origin ? url.slice(origin.length) : null;
+};
+const isApiUrl = (url) => apiPath(url) !== null;
+// /token, /token/refresh and /token/revoke answer 401 for bad credentials, not an expired session
+const isAuthUrl = (url) => apiPath(url)?.startsWith('/token') ?? false;
+
+export const clearSession = () => {
+  localStorage.removeItem('token');
+  localStorage.removeItem('refresh_token');
+  localStorage.removeItem('user');
+};
+
+const endSession = () => {
+  clearSession();
+  window.location.href = '/login';
+};
+
+// Trade the stored refresh token for a new access token. Concurrent 401s in this
+// tab share one request, and tabs take turns through a Web Lock: a tab that
+// waited finds the token the other tab just stored instead of replaying the one
+// that was rotated out, which would get the whole login revoked.
+let refreshPromise = null;
+const rotateRefreshToken = async (staleRefreshToken) => {
+  const refreshToken = localStorage.getItem('refresh_token');
+  if (!refreshToken) {
+    throw new Error('No refresh token');
+  }
+  if (refreshToken !== staleRefreshToken) {
+    // Another tab refreshed while we waited
+    return localStorage.getItem('token');
+  }
+  try {
+    const { data } = await axios.post(`${API_URL}/token/refresh`, { refresh_token: refreshToken });
+    localStorage.setItem('token', data.access_token);
+    localStorage.setItem('refresh_token', data.refresh_token);
+    return data.access_token;
+  } catch (error) {
+    // Without Web Locks another tab can still win the race; the server gives a
+    // just-rotated token a grace period, so pick up that tab's token if it landed
+    if (localStorage.getItem('refresh_token') !== refreshToken) {
+      return localStorage.getItem('token');
     }
+    throw error;
+  }
+};
+
+const refreshAccessToken = () => {
+  if (!refreshPromise) {
+    const staleRefreshToken = localStorage.getItem('refresh_token');
+    const rotate = () => rotateRefreshToken(staleRefreshToken);
+    refreshPromise = (navigator.locks ? navigator.locks.request('skilllink-token-refresh', rotate) : rotate())
+      .finally(() => {
+        refreshPromise = null;
+      });
+  }
+  return refreshPromise;
+};
+
+// Shared 401 handling for axios clients: refresh once and retry, else log out
+export const retryWithRefreshedToken = (client) => async (error) => {
+  const original = error.config;
+  const url = original?.baseURL && !original.url?.startsWith('http')
+    ? `${original.baseURL}${original.url}`
+    : original?.url;
+  if (error.response?.status !== 401 || !isApiUrl(url) || isAuthUrl(url)) {
     return Promise.reject(error);
   }
+  if (!original._retried) {
+    original._retried = true;
+    try {
+      const token = await refreshAccessToken();
+      original.headers.Authorization = `Bearer ${token}`;
+      return client(original);
+    } catch (refreshError) {
+      // Fall through to logging out
+    }
+  }
+  endSession();
+  return Promise.reject(error);
+};
+
+// Response interceptor
+api.interceptors.response.use(
+  (response) => response.data,
+  retryWithRefreshedToken(api)
 );
 
+// Pages that call axios or fetch directly get the same refresh-and-retry as `api`
+export const installAuthInterceptors = () => {
+  axios.interceptors.response.use((response) => response, retryWithRefreshedToken(axios));
+
+  const nativeFetch = window.fetch.bind(window);
+  window.fetch = async (input, init = {}) => {
+    const url = typeof input === 'string' ? input : input.url;
+    const response = await nativeFetch(input, init);
+    // Request objects may carry a consumed body, so only plain URLs are retried
+    if (response.status !== 401 || typeof input !== 'string' || !isApiUrl(url) || isAuthUrl(url)) {
+      return response;
+    }
+    let token;
+    try {
+      token = await refreshAccessToken();
+    } catch (refreshError) {
+      endSession();
+      return response;
+    }
+    const headers = new Headers(init.headers);
+    headers.set('Authorization', `Bearer ${token}`);
+    return nativeFetch(input, { ...init, headers });
+  };
+};
+
 // API endpoints
 export const API = {
   // Auth - FIXED: Accepts email as username
@@ -53,6 +157,7 @@ export const API = {
     },
     register: (data) => api.post('/register', data),
     me: () => api.get('/users/me'),
+    revoke: (refreshToken) => api.post('/token/revoke', { refresh_token: refreshToken }),
   },
   
   // Jobs